@@ -15,11 +15,24 @@ from dotenv import load_dotenv
 # --- Configuration ---
 load_dotenv()
 DB_PATH = os.getenv('DATABASE_PATH', './data/processed/hr_data.db')
+# COMPACT_DATA keeps only the columns the charts read, as categoricals and downcast numerics.
+COMPACT_DATA = os.getenv('COMPACT_DATA', 'false').lower() in ('1', 'true', 'yes')
+
+# Columns read by the chart functions; everything else is dropped in compact mode.
+CHART_COLUMNS = [
+    'employeeid', 'jobrole', 'gender', 'performancerating', 'careerlevel', 'department',
+    'tenure_bins', 'training_bins', 'riskscore', 'jobsatisfactionscore', 'worklifebalancerating',
+    'managersatisfactionscore', 'monthlysalary', 'attrition', 'role_criticality', 'replacement_cost'
+]
+# Object columns with fewer unique values than this fraction of rows become categoricals.
+CATEGORY_MAX_RATIO = 0.5
+# Raw inputs that the feature engineering in process_data() derives chart columns from.
+SOURCE_COLUMNS = ['dateofjoining', 'traininghourscompleted']
 
 # --- Data Loading & Processing ---
 # In advanced_dashboard.py, replace the existing load_comprehensive_data function with this one.
 
-def load_comprehensive_data():
+def load_comprehensive_data(compact=COMPACT_DATA):
     """Load and process comprehensive HR data with robust column name handling."""
     
     # Add this print statement for debugging
@@ -27,7 +40,7 @@ def load_comprehensive_data():
     
     if not os.path.exists(DB_PATH):
         print("💡 Database not found. Falling back to sample data creation.")
-        return create_sample_data()
+        return create_sample_data(compact)
     
     try:
         conn = sqlite3.connect(DB_PATH)
@@ -38,7 +51,7 @@ def load_comprehensive_data():
         
         if df.empty:
             print("⚠️ Database table is empty. Falling back to sample data.")
-            return create_sample_data()
+            return create_sample_data(compact)
 
         # --- KEY FIX: Standardize all column names to lowercase ---
         df.columns = [col.strip().lower() for col in df.columns]
@@ -46,22 +59,21 @@ def load_comprehensive_data():
         # Now, check for the lowercase 'employeeid'
         if 'employeeid' not in df.columns:
             print(f"❌ Critical Error: 'employeeid' column not found after standardization. Available columns: {df.columns.tolist()}")
-            return create_sample_data()
+            return create_sample_data(compact)
 
         print(f"✅ Successfully loaded {len(df)} records from the database.")
-        return process_data(df)
+        return process_data(df, compact)
         
     except Exception as e:
         print(f"❌ An error occurred while reading the database: {e}")
         print("Falling back to sample data.")
-        return create_sample_data()
+        return create_sample_data(compact)
 
 
 
-def create_sample_data():
+def create_sample_data(compact=COMPACT_DATA, n_employees=1000):
     """Create comprehensive sample data if database is not available"""
     np.random.seed(42)
-    n_employees = 1000
     roles = ['Data Scientist', 'Software Engineer', 'Product Manager', 'Data Analyst', 'ML Engineer', 'QA', 'Project Manager', 'DevOps']
     cities = ['Mumbai', 'Bangalore', 'Delhi', 'Hyderabad', 'Pune']
     
@@ -83,10 +95,13 @@ def create_sample_data():
         'dateofjoining': pd.to_datetime('2020-01-01') + pd.to_timedelta(np.random.randint(0, 1825, n_employees), unit='D')
     })
     
-    return process_data(df)
+    return process_data(df, compact)
 
-def process_data(df):
+def process_data(df, compact=COMPACT_DATA):
     """Process and engineer features for all visualizations"""
+    if compact:
+        # Drop unused raw columns (city, bonusamount, ...) before adding any derived ones
+        df = df[[col for col in df.columns if col in CHART_COLUMNS or col in SOURCE_COLUMNS]].copy()
     df['department'] = df['jobrole'].apply(lambda x: 'Tech' if 'Engineer' in x else 'Product' if 'Product' in x else 'Data')
     df['tenure_months'] = (pd.Timestamp.now() - pd.to_datetime(df['dateofjoining'])).dt.days / 30.44
     df['tenure_bins'] = pd.cut(df['tenure_months'], bins=[0, 12, 36, 60, 120], labels=['<1yr', '1-3yrs', '3-5yrs', '5+yrs'], include_lowest=True).astype(str)
@@ -95,7 +110,26 @@ def process_data(df):
     df['role_criticality'] = df['jobrole'].isin(['Data Scientist', 'Product Manager']).astype(int)
     df['replacement_cost'] = df['monthlysalary'] * 3
     
-    return df
+    return compact_data(df) if compact else df
+
+def compact_data(df):
+    """
+    Shrink the frame each worker keeps in memory: drop columns the charts never read,
+    turn low-cardinality strings into categoricals and downcast numerics. The final
+    copy consolidates each dtype into a single contiguous NumPy block.
+    """
+    df = df[[col for col in CHART_COLUMNS if col in df.columns]]
+    compact = {}
+    for col in df.columns:
+        series = df[col]
+        if series.dtype == object and series.nunique() < CATEGORY_MAX_RATIO * len(series):
+            series = series.astype('category')
+        elif pd.api.types.is_integer_dtype(series):
+            series = pd.to_numeric(series, downcast='integer')
+        elif pd.api.types.is_float_dtype(series):
+            series = pd.to_numeric(series, downcast='float')
+        compact[col] = series
+    return pd.DataFrame(compact).copy()
 
 # --- Chart Creation Functions ---
 
@@ -150,17 +184,19 @@ def create_chart_1_financial_impact(df):
     ])
 
 def create_chart_2_risk_heatmap(df):
-    heatmap_data = df.pivot_table(index='department', columns='jobrole', values='riskscore', aggfunc='mean')
+    heatmap_data = df.pivot_table(index='department', columns='jobrole', values='riskscore', aggfunc='mean', observed=True)
     fig = px.imshow(heatmap_data, color_continuous_scale="RdYlGn_r", aspect="auto")
     return dcc.Graph(figure=fig, config={'displayModeBar': False})
 
 def create_chart_3_workforce_roi(df):
-    df['revenue_per_employee'] = df['monthlysalary'] * np.random.uniform(3, 6, len(df))
-    roi_data = df.groupby('department').agg(
-        revenue_per_employee=('revenue_per_employee', 'mean'),
-        monthlysalary=('monthlysalary', 'mean'),
-        employeeid=('employeeid', 'count')
-    ).reset_index()
+    # Kept as a local Series so the shared (possibly compact) frame is not modified
+    revenue_per_employee = df['monthlysalary'] * np.random.uniform(3, 6, len(df))
+    by_department = df.groupby('department', observed=True)
+    roi_data = pd.DataFrame({
+        'revenue_per_employee': revenue_per_employee.groupby(df['department'], observed=True).mean(),
+        'monthlysalary': by_department['monthlysalary'].mean(),
+        'employeeid': by_department['employeeid'].count()
+    }).reset_index()
     fig = px.scatter(roi_data, x='monthlysalary', y='revenue_per_employee', size='employeeid', color='department')
     return dcc.Graph(figure=fig, config={'displayModeBar': False})
 
@@ -171,7 +207,7 @@ def create_chart_4_forecast(df):
     return dcc.Graph(figure=fig, config={'displayModeBar': False})
 
 def create_chart_5_attrition_analysis(df):
-    attrition_by_dept = df.groupby('department')['attrition'].mean().reset_index()
+    attrition_by_dept = df.groupby('department', observed=True)['attrition'].mean().reset_index()
     fig = px.bar(attrition_by_dept, x='department', y='attrition', color='attrition',
                  color_continuous_scale='Reds', labels={'department': 'Department', 'attrition': 'Attrition Rate'})
     return dcc.Graph(figure=fig, config={'displayModeBar': False})
@@ -185,7 +221,7 @@ def create_chart_6_recruitment(df):
     return dcc.Graph(figure=fig, config={'displayModeBar': False})
 
 def create_chart_7_engagement(df):
-    engagement_data = df.groupby('department')[['jobsatisfactionscore', 'worklifebalancerating']].mean().reset_index()
+    engagement_data = df.groupby('department', observed=True)[['jobsatisfactionscore', 'worklifebalancerating']].mean().reset_index()
     fig = px.bar(engagement_data, x='department', y=['jobsatisfactionscore', 'worklifebalancerating'],
                  barmode='group', labels={'value': 'Average Score', 'variable': 'Metric'})
     return dcc.Graph(figure=fig, config={'displayModeBar': False})
@@ -200,7 +236,7 @@ def create_chart_9_demographics(df):
     return dcc.Graph(figure=fig, config={'displayModeBar': False})
 
 def create_chart_10_compensation(df):
-    comp_data = df.groupby('jobrole').agg(
+    comp_data = df.groupby('jobrole', observed=True).agg(
         monthlysalary=('monthlysalary', 'mean'),
         riskscore=('riskscore', 'mean')
     ).reset_index()
@@ -209,7 +245,7 @@ def create_chart_10_compensation(df):
     return dcc.Graph(figure=fig, config={'displayModeBar': False})
 
 def create_chart_11_learning_roi(df):
-    training_impact = df.groupby('training_bins').agg(
+    training_impact = df.groupby('training_bins', observed=True).agg(
         riskscore=('riskscore', 'mean'),
         avg_satisfaction=('jobsatisfactionscore', 'mean')
     ).reset_index()
@@ -238,7 +274,8 @@ def create_chart_13_daily_pulse(df):
 def create_chart_14_risk_monitoring(df):
     high_risk = df[df['riskscore'] > 0.7].nlargest(10, 'riskscore')
     return dash_table.DataTable(
-        data=high_risk[['employeeid', 'jobrole', 'department', 'riskscore']].round(3).to_dict('records'),
+        # Round in float64 so a compact float32 riskscore still displays as e.g. 0.783
+        data=high_risk[['employeeid', 'jobrole', 'department', 'riskscore']].astype({'riskscore': 'float64'}).round(3).to_dict('records'),
         columns=[{'name': i.title(), 'id': i} for i in ['employeeid', 'jobrole', 'department', 'riskscore']],
         style_data_conditional=[{'if': {'filter_query': '{riskscore} > 0.8'}, 'backgroundColor': '#ffebee'}]
     )
@@ -249,13 +286,13 @@ def create_chart_15_talent_pipeline(df):
     return dcc.Graph(figure=fig, config={'displayModeBar': False})
 
 def create_chart_16_journey_mapping(df):
-    journey_data = df.groupby('tenure_bins')['jobsatisfactionscore'].mean().reset_index()
+    journey_data = df.groupby('tenure_bins', observed=True)['jobsatisfactionscore'].mean().reset_index()
     fig = px.line(journey_data, x='tenure_bins', y='jobsatisfactionscore', markers=True,
                   labels={'tenure_bins': 'Tenure', 'jobsatisfactionscore': 'Avg. Job Satisfaction'})
     return dcc.Graph(figure=fig, config={'displayModeBar': False})
 
 def create_chart_17_compensation_analytics(df):
-    comp_analysis = df.groupby('jobrole').agg(
+    comp_analysis = df.groupby('jobrole', observed=True).agg(
         avg_salary=('monthlysalary', 'mean'),
         salary_std=('monthlysalary', 'std')
     ).reset_index()
@@ -1,11 +1,11 @@
 # /hr_ai_assistant/app/main.py
 
 from flask import Flask, request, jsonify, redirect
-import joblib
-import pandas as pd
 import os
+import threading
+import time
+from datetime import datetime
 from dotenv import load_dotenv
-from advanced_dashboard import create_advanced_dashboard
 
 # Load environment variables from .env file
 load_dotenv()
@@ -16,21 +16,143 @@ server = Flask(__name__)
 # --- Configuration ---
 MODEL_PATH = os.getenv('MODEL_PATH', './models/attrition_pipeline.joblib')
 DB_PATH = os.getenv('DATABASE_PATH', './data/processed/hr_data.db')
+# LAZY_INIT defers the model, pandas/plotly/dash imports and the dashboard build
+# until first use; WARMUP_ON_BOOT then does that work in a background thread,
+# started by the first request each worker process receives (never at import,
+# so a preloading master can fork safely). A failed warm-up is retried at most
+# once every WARMUP_RETRY_SECONDS.
+LAZY_INIT = os.getenv('LAZY_INIT', 'false').lower() in ('1', 'true', 'yes')
+WARMUP_ON_BOOT = os.getenv('WARMUP_ON_BOOT', 'true').lower() in ('1', 'true', 'yes')
+WARMUP_RETRY_SECONDS = float(os.getenv('WARMUP_RETRY_SECONDS', '30'))
+DASHBOARD_PREFIX = '/dashboard/'
 
-# --- Load Model ---
+# --- Lazily Initialised Components ---
 pipeline = None
-try:
-    if os.path.exists(MODEL_PATH):
-        pipeline = joblib.load(MODEL_PATH)
-        print("✅ Model pipeline loaded successfully.")
-    else:
-        print(f"❌ MODEL NOT FOUND at {MODEL_PATH}")
-except Exception as e:
-    print(f"❌ Error loading model: {e}")
+app = None
+_model_initialised = False
+_dashboard_initialised = False
+_model_lock = threading.Lock()
+_dashboard_lock = threading.Lock()
+_warmup_lock = threading.Lock()
+_warmup_thread = None
+_warmup_pid = None
+_warmup_finished_at = float('-inf')
+
+def _reset_locks_after_fork():
+    """A forked worker must not inherit locks or warm-up state from its parent."""
+    global _model_lock, _dashboard_lock, _warmup_lock, _warmup_thread, _warmup_pid, _warmup_finished_at
+    _model_lock = threading.Lock()
+    _dashboard_lock = threading.Lock()
+    _warmup_lock = threading.Lock()
+    _warmup_thread = None
+    _warmup_pid = None
+    _warmup_finished_at = float('-inf')
+
+os.register_at_fork(after_in_child=_reset_locks_after_fork)
+
+def get_pipeline(reload=False):
+    """
+    Loads the model pipeline on first call and returns it (None if unavailable).
+    With reload=True a previously failed load is attempted again.
+    """
+    global pipeline, _model_initialised
+    if _model_initialised and (pipeline is not None or not reload):
+        return pipeline
+    with _model_lock:
+        if not _model_initialised or (pipeline is None and reload):
+            try:
+                if os.path.exists(MODEL_PATH):
+                    import joblib
+                    pipeline = joblib.load(MODEL_PATH)
+                    print("✅ Model pipeline loaded successfully.")
+                else:
+                    print(f"❌ MODEL NOT FOUND at {MODEL_PATH}")
+            except Exception as e:
+                print(f"❌ Error loading model: {e}")
+            _model_initialised = True
+    return pipeline
+
+def get_dashboard():
+    """
+    Builds the Dash app on first call and returns it.
+    In lazy mode it gets its own Flask server, since routes cannot be added
+    to the main server once it has started handling requests.
+    """
+    global app, _dashboard_initialised
+    if _dashboard_initialised:
+        return app
+    with _dashboard_lock:
+        if not _dashboard_initialised:
+            # This function is imported from advanced_dashboard.py and it sets up the Dash app
+            from advanced_dashboard import create_advanced_dashboard
+            app = create_advanced_dashboard(Flask('dashboard') if LAZY_INIT else server)
+            _dashboard_initialised = True
+    return app
 
-# --- Create and Attach the Advanced Dashboard ---
-# This function is imported from advanced_dashboard.py and it sets up the Dash app
-app = create_advanced_dashboard(server)
+def warm_up():
+    """Initialises every component so the first real request does not pay for it."""
+    global _warmup_finished_at
+    try:
+        get_pipeline(reload=True)
+        get_dashboard()
+        if not is_ready():
+            print("⚠️ Warm-up finished but the model is not loaded; the app is not ready.")
+            return
+        print("✅ Warm-up complete, application is ready.")
+    except Exception as e:
+        print(f"❌ Error during warm-up: {e}")
+    finally:
+        _warmup_finished_at = time.monotonic()
+
+def start_warmup():
+    """
+    Starts the background warm-up thread for this process unless it is running,
+    the application is ready, or the last attempt failed less than
+    WARMUP_RETRY_SECONDS ago.
+    """
+    global _warmup_thread, _warmup_pid
+    with _warmup_lock:
+        this_process = _warmup_pid == os.getpid()
+        running = this_process and _warmup_thread.is_alive()
+        backing_off = this_process and time.monotonic() - _warmup_finished_at < WARMUP_RETRY_SECONDS
+        if not (running or backing_off or is_ready()):
+            _warmup_thread = threading.Thread(target=warm_up, name='warmup', daemon=True)
+            _warmup_pid = os.getpid()
+            _warmup_thread.start()
+    return _warmup_thread
+
+def is_ready():
+    """Ready once the dashboard is built and the model has actually loaded."""
+    return _model_initialised and pipeline is not None and _dashboard_initialised
+
+def _model_status():
+    if not _model_initialised:
+        return 'pending'
+    return 'loaded' if pipeline is not None else 'not_loaded'
+
+class LazyDashboardMiddleware:
+    """Sends dashboard requests to the Dash app, building it on the first hit."""
+
+    def __init__(self, wsgi_app, prefix=DASHBOARD_PREFIX):
+        self.wsgi_app = wsgi_app
+        self.prefix = prefix
+
+    def __call__(self, environ, start_response):
+        # Each worker process warms itself up on its first request, and retries from here.
+        if WARMUP_ON_BOOT and not is_ready():
+            start_warmup()
+        path = environ.get('PATH_INFO', '')
+        # The bare prefix goes to Dash too, which redirects it to the trailing-slash URL.
+        if path.startswith(self.prefix) or path == self.prefix.rstrip('/'):
+            return get_dashboard().server.wsgi_app(environ, start_response)
+        return self.wsgi_app(environ, start_response)
+
+# --- Load Model and Create the Advanced Dashboard ---
+if LAZY_INIT:
+    server.wsgi_app = LazyDashboardMiddleware(server.wsgi_app)
+else:
+    get_pipeline()
+    get_dashboard()
 
 # --- API Routes ---
 
@@ -45,6 +167,7 @@ def predict():
     Enhanced prediction endpoint for employee attrition risk.
     Accepts a JSON payload with 'employee_id'.
     """
+    pipeline = get_pipeline()
     if not pipeline: 
         return jsonify({'error': 'Model not loaded or available'}), 500
     
@@ -79,18 +202,41 @@ def predict():
 
 @server.route('/health', methods=['GET'])
 def health_check():
-    """Provides a health check of the application components."""
+    """
+    Liveness check: answers as soon as the process is up and never waits on
+    the model or dashboard. Use /ready to know when they are initialised.
+    """
     return jsonify({
         'status': 'healthy',
         'database_status': 'connected' if os.path.exists(DB_PATH) else 'not_found',
-        'model_status': 'loaded' if pipeline else 'not_loaded',
-        'timestamp': pd.Timestamp.now().isoformat()
+        'model_status': _model_status(),
+        'timestamp': datetime.now().isoformat()
     })
 
+@server.route('/ready', methods=['GET'])
+def readiness_check():
+    """
+    Readiness check: returns 503 until the dashboard is built and the model is
+    loaded. It only reports; the warm-up and its retries are driven elsewhere.
+    """
+    ready = is_ready()
+    if ready:
+        status = 'ready'
+    else:
+        status = 'model_not_loaded' if _model_status() == 'not_loaded' else 'initialising'
+    return jsonify({
+        'status': status,
+        'model_status': _model_status(),
+        'model_initialised': _model_initialised,
+        'dashboard_initialised': _dashboard_initialised,
+        'timestamp': datetime.now().isoformat()
+    }), 200 if ready else 503
+
 # --- Main Execution ---
 if __name__ == '__main__':
     print("🚀 Starting Enterprise HR Analytics Suite...")
     print(f"   📊 Dashboard available at: http://127.0.0.1:5001/dashboard/")
     print(f"   🔗 Prediction API at: http://127.0.0.1:5001/predict (POST)")
     print(f"   🏥 Health Check at: http://127.0.0.1:5001/health (GET)")
+    print(f"   🚦 Readiness Check at: http://127.0.0.1:5001/ready (GET)")
     server.run(host='0.0.0.0', port=5001, debug=True)
@@ -0,0 +1,105 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pandas as pd
+
+# Runs inside a fresh interpreter so each mode's resident memory is measured on its own.
+# It builds the whole dashboard like a worker does; the frame is local to that build,
+# so the steady-state RSS is what a worker keeps and the peak covers the frame build.
+PROBE = """
+import functools, gc, json, sys
+from flask import Flask
+import advanced_dashboard as ad
+# Scale the sample data the dashboard falls back to (the probe points DATABASE_PATH nowhere)
+ad.create_sample_data = functools.partial(ad.create_sample_data, n_employees=int(sys.argv[1]))
+ad.create_advanced_dashboard(Flask('probe'))
+gc.collect()
+# VmHWM, unlike ru_maxrss, is not inherited from the benchmark process across fork/exec
+memory = {}
+with open('/proc/self/status') as status:
+    for line in status:
+        if line.startswith(('VmRSS:', 'VmHWM:')):
+            memory[line.split(':')[0]] = int(line.split()[1])
+print(json.dumps({'rss_kb': memory['VmRSS'], 'peak_kb': memory['VmHWM']}))
+"""
+
+# The group-by/pivot step of each chart function, timed without the Plotly figure build.
+GROUPBY_QUERIES = {
+    'chart_2_risk_heatmap': lambda df: df.pivot_table(
+        index='department', columns='jobrole', values='riskscore', aggfunc='mean', observed=True),
+    'chart_3_workforce_roi': lambda df: df.groupby('department', observed=True).agg(
+        monthlysalary=('monthlysalary', 'mean'), employeeid=('employeeid', 'count')),
+    'chart_5_attrition_analysis': lambda df: df.groupby('department', observed=True)['attrition'].mean(),
+    'chart_7_engagement': lambda df: df.groupby('department', observed=True)[
+        ['jobsatisfactionscore', 'worklifebalancerating']].mean(),
+    'chart_9_demographics': lambda df: df.groupby(['department', 'gender'], observed=True)['employeeid'].sum(),
+    'chart_10_compensation': lambda df: df.groupby('jobrole', observed=True).agg(
+        monthlysalary=('monthlysalary', 'mean'), riskscore=('riskscore', 'mean')),
+    'chart_11_learning_roi': lambda df: df.groupby('training_bins', observed=True).agg(
+        riskscore=('riskscore', 'mean'), avg_satisfaction=('jobsatisfactionscore', 'mean')),
+    'chart_12_manager_performance': lambda df: df.groupby(
+        pd.cut(df['managersatisfactionscore'], bins=5).astype(str)).agg(
+        riskscore=('riskscore', 'mean'), employeeid=('employeeid', 'count')),
+    'chart_16_journey_mapping': lambda df: df.groupby('tenure_bins', observed=True)['jobsatisfactionscore'].mean(),
+    'chart_17_compensation_analytics': lambda df: df.groupby('jobrole', observed=True).agg(
+        avg_salary=('monthlysalary', 'mean'), salary_std=('monthlysalary', 'std')),
+}
+
+def run_probe(app_dir, mode, n_employees):
+    """Builds the dashboard in a subprocess and returns its steady-state and peak RSS."""
+    env = dict(os.environ, COMPACT_DATA='true' if mode == 'compact' else 'false',
+               DATABASE_PATH=os.path.join(app_dir, 'no-database.db'))
+    result = subprocess.run([sys.executable, '-c', PROBE, str(n_employees)], cwd=app_dir, env=env,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def time_groupbys(df, repeats):
+    """Returns the best wall time in seconds of each chart's group-by step."""
+    timings = {}
+    for name, query in GROUPBY_QUERIES.items():
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            query(df)
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+    return timings
+
+def run_memory_benchmark(n_employees=100000, repeats=5):
+    """
+    Compares the default and the compact loading modes: DataFrame size, worker
+    RSS after the dashboard is built and peak RSS while building it, and the
+    time taken by the charts' group-bys.
+    """
+    try:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        project_root = os.path.dirname(script_dir)
+    except NameError:
+        project_root = os.getcwd()
+    app_dir = os.path.join(project_root, 'app')
+    sys.path.insert(0, app_dir)
+    import advanced_dashboard as ad
+
+    print(f"🧠 Memory benchmark ({n_employees:,} employees)\n")
+    default_df = ad.create_sample_data(compact=False, n_employees=n_employees)
+    compact_df = ad.create_sample_data(compact=True, n_employees=n_employees)
+
+    print(f"   {'mode':<10}{'frame (MB)':>12}{'worker RSS (MB)':>18}{'peak RSS (MB)':>16}")
+    for mode, df in (('default', default_df), ('compact', compact_df)):
+        probe = run_probe(app_dir, mode, n_employees)
+        frame_mb = df.memory_usage(deep=True).sum() / 1e6
+        print(f"   {mode:<10}{frame_mb:>12.2f}{probe['rss_kb'] / 1024:>18.1f}{probe['peak_kb'] / 1024:>16.1f}")
+    default_times = time_groupbys(default_df, repeats)
+    compact_times = time_groupbys(compact_df, repeats)
+
+    print(f"\n⏱️  Chart group-by time (best of {repeats}, ms)\n")
+    print(f"   {'chart':<42}{'default':>10}{'compact':>10}")
+    for name in GROUPBY_QUERIES:
+        print(f"   {name:<42}{default_times[name] * 1000:>10.1f}{compact_times[name] * 1000:>10.1f}")
+    print(f"   {'total':<42}{sum(default_times.values()) * 1000:>10.1f}{sum(compact_times.values()) * 1000:>10.1f}")
+
+if __name__ == "__main__":
+    run_memory_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,60 @@
+import json
+import os
+import subprocess
+import sys
+
+# Runs inside a fresh interpreter so import caches from earlier runs do not skew the timings.
+PROBE = """
+import json, time
+t0 = time.perf_counter()
+import main
+t_import = time.perf_counter() - t0
+client = main.server.test_client()
+client.get('/health')
+t_health = time.perf_counter() - t0
+deadline = time.perf_counter() + 120
+while client.get('/ready').status_code != 200:
+    if time.perf_counter() > deadline:
+        raise SystemExit('application did not become ready (is the model loadable?)')
+    time.sleep(0.01)
+t_ready = time.perf_counter() - t0
+# /ready turns 200 before the warm-up thread logs; let it finish so its output cannot split the result line.
+if main._warmup_thread is not None:
+    main._warmup_thread.join()
+print('RESULT ' + json.dumps({'import': t_import, 'first_health': t_health, 'ready': t_ready}))
+"""
+
+def run_probe(app_dir, lazy):
+    """Boots main.py in a subprocess and returns its timings in seconds."""
+    # Point at the shipped model so the joblib/xgboost load is part of what gets measured.
+    model_path = os.path.join(app_dir, 'models', 'attrition_pipeline_v2.joblib')
+    env = dict(os.environ, LAZY_INIT='true' if lazy else 'false', WARMUP_ON_BOOT='true',
+               MODEL_PATH=model_path)
+    result = subprocess.run([sys.executable, '-c', PROBE], cwd=app_dir, env=env,
+                            capture_output=True, text=True, check=True)
+    # Loading messages precede the result, so pick the tagged line.
+    line = next(l for l in result.stdout.splitlines() if l.startswith('RESULT '))
+    return json.loads(line[len('RESULT '):])
+
+def run_startup_benchmark(repeats=3):
+    """
+    Measures import time, time to the first /health response and time until
+    /ready returns 200, for both the eager and the lazy initialisation modes.
+    """
+    try:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        project_root = os.path.dirname(script_dir)
+    except NameError:
+        project_root = os.getcwd()
+    app_dir = os.path.join(project_root, 'app')
+
+    print(f"⏱️  Startup benchmark ({repeats} runs per mode, best time shown)\n")
+    print(f"   {'mode':<8}{'import (s)':>12}{'/health (s)':>14}{'/ready (s)':>13}")
+    for lazy in (False, True):
+        runs = [run_probe(app_dir, lazy) for _ in range(repeats)]
+        best = {key: min(run[key] for run in runs) for key in runs[0]}
+        mode = 'lazy' if lazy else 'eager'
+        print(f"   {mode:<8}{best['import']:>12.3f}{best['first_health']:>14.3f}{best['ready']:>13.3f}")
+
+if __name__ == "__main__":
+    run_startup_benchmark()
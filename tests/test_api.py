@@ -0,0 +1,126 @@
+import importlib
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app')
+MODEL_PATH = os.path.join(APP_DIR, 'models', 'attrition_pipeline_v2.joblib')
+sys.path.insert(0, APP_DIR)
+
+
+@pytest.fixture
+def lazy_main(monkeypatch):
+    """Imports main.py in lazy mode with the background warm-up disabled."""
+    monkeypatch.setenv('LAZY_INIT', 'true')
+    monkeypatch.setenv('WARMUP_ON_BOOT', 'false')
+    monkeypatch.setenv('MODEL_PATH', MODEL_PATH)
+    sys.modules.pop('main', None)
+    main = importlib.import_module('main')
+    yield main
+    if main._warmup_thread is not None:
+        main._warmup_thread.join()
+    sys.modules.pop('main', None)
+
+
+def test_lazy_import_defers_model_and_dashboard(lazy_main):
+    assert not lazy_main._model_initialised
+    assert not lazy_main._dashboard_initialised
+    assert lazy_main.app is None
+
+
+def test_health_does_not_trigger_initialisation(lazy_main):
+    response = lazy_main.server.test_client().get('/health')
+    assert response.status_code == 200
+    assert response.get_json()['model_status'] == 'pending'
+    assert not lazy_main._model_initialised
+
+
+def test_ready_reports_503_then_200_after_warmup(lazy_main):
+    client = lazy_main.server.test_client()
+    response = client.get('/ready')
+    assert response.status_code == 503
+    assert response.get_json()['status'] == 'initialising'
+
+    lazy_main.start_warmup().join()
+    response = client.get('/ready')
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 'ready'
+
+
+def test_predict_loads_model_on_first_use(lazy_main):
+    client = lazy_main.server.test_client()
+    client.post('/predict', json={'employee_id': 1001})
+    assert lazy_main._model_initialised
+    assert not lazy_main._dashboard_initialised
+
+
+def test_dashboard_built_on_first_request(lazy_main):
+    response = lazy_main.server.test_client().get('/dashboard/')
+    assert response.status_code == 200
+    assert lazy_main._dashboard_initialised
+    assert lazy_main.app is not None
+
+
+def test_ready_stays_503_without_model_and_backs_off(lazy_main, monkeypatch):
+    monkeypatch.setattr(lazy_main, 'MODEL_PATH', os.path.join(APP_DIR, 'models', 'missing.joblib'))
+    monkeypatch.setattr(lazy_main, 'WARMUP_ON_BOOT', True)
+    client = lazy_main.server.test_client()
+    client.get('/health')
+    failed_thread = lazy_main._warmup_thread
+    failed_thread.join()
+
+    for _ in range(5):
+        response = client.get('/ready')
+        assert response.status_code == 503
+        assert response.get_json()['status'] == 'model_not_loaded'
+    assert lazy_main._warmup_thread is failed_thread
+
+
+def test_failed_warmup_is_retried_after_backoff(lazy_main, monkeypatch):
+    def broken_dashboard():
+        raise RuntimeError('boom')
+
+    original_dashboard = lazy_main.get_dashboard
+    monkeypatch.setattr(lazy_main, 'get_dashboard', broken_dashboard)
+    failed_thread = lazy_main.start_warmup()
+    failed_thread.join()
+    assert lazy_main.start_warmup() is failed_thread
+
+    monkeypatch.setattr(lazy_main, 'get_dashboard', original_dashboard)
+    monkeypatch.setattr(lazy_main, 'WARMUP_RETRY_SECONDS', 0)
+    retry_thread = lazy_main.start_warmup()
+    assert retry_thread is not failed_thread
+    retry_thread.join()
+    assert lazy_main.server.test_client().get('/ready').status_code == 200
+
+
+def test_worker_forked_right_after_import_becomes_ready():
+    script = textwrap.dedent("""
+        import os, sys, time
+        import main
+        pid = os.fork()
+        if pid == 0:
+            client = main.server.test_client()
+            deadline = time.monotonic() + 60
+            while client.get('/ready').status_code != 200:
+                if time.monotonic() > deadline:
+                    os._exit(1)
+                time.sleep(0.05)
+            os._exit(0)
+        _, status = os.waitpid(pid, 0)
+        # The parent never served a request, so it must not have started a warm-up.
+        sys.exit(os.waitstatus_to_exitcode(status) or int(main._warmup_thread is not None))
+    """)
+    env = dict(os.environ, LAZY_INIT='true', WARMUP_ON_BOOT='true', MODEL_PATH=MODEL_PATH)
+    result = subprocess.run([sys.executable, '-c', script], cwd=APP_DIR, env=env,
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_dashboard_without_trailing_slash_redirects(lazy_main):
+    response = lazy_main.server.test_client().get('/dashboard')
+    assert response.status_code == 308
+    assert response.headers['Location'].endswith('/dashboard/')
@@ -0,0 +1,41 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app'))
+
+import advanced_dashboard as ad
+
+
+def test_compact_data_drops_unused_columns_and_shrinks_dtypes():
+    df = ad.create_sample_data(compact=True)
+    assert list(df.columns) == ad.CHART_COLUMNS
+    for col in ['jobrole', 'gender', 'careerlevel', 'department', 'tenure_bins', 'training_bins']:
+        assert isinstance(df[col].dtype, pd.CategoricalDtype)
+    assert df['riskscore'].dtype == 'float32'
+    assert df['attrition'].dtype == 'int8'
+
+
+def test_compact_data_uses_less_memory_and_keeps_aggregates():
+    default_df = ad.create_sample_data(compact=False)
+    compact_df = ad.create_sample_data(compact=True)
+    assert compact_df.memory_usage(deep=True).sum() < default_df.memory_usage(deep=True).sum() / 4
+
+    expected = default_df.groupby('department')['riskscore'].mean()
+    actual = compact_df.groupby('department', observed=True)['riskscore'].mean()
+    actual.index = actual.index.astype(object)
+    pd.testing.assert_series_equal(actual.astype('float64'), expected, rtol=1e-5)
+
+
+def test_compact_data_keeps_risk_monitoring_table():
+    default_table = ad.create_chart_14_risk_monitoring(ad.create_sample_data(compact=False))
+    compact_table = ad.create_chart_14_risk_monitoring(ad.create_sample_data(compact=True))
+    assert compact_table.data == default_table.data
+
+
+def test_workforce_roi_chart_does_not_modify_frame():
+    df = ad.create_sample_data(compact=True)
+    columns = list(df.columns)
+    ad.create_chart_3_workforce_roi(df)
+    assert list(df.columns) == columns